@@ -6,12 +6,32 @@ merge_macros.py - v3.23.0
 - Working whitelist + random file queue
 """
 
-import argparse, json, random, re, sys, os, math, shutil
+import argparse, functools, json, random, re, os, math, shutil
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
 from pathlib import Path
 
+try:
+    import orjson  # optional: much faster parse/encode of the event files
+except ImportError:
+    orjson = None
+
 # Script version
 VERSION = "v3.25.0"
 
+# Precompiled patterns for folder-name parsing
+COPY_SUFFIX_RE = re.compile(r'(\s*-\s*Copy(\s*\(\d+\))?)|(\s*\(\d+\))', re.IGNORECASE)
+FOLDER_NUMBER_RE = re.compile(r'^(\d+)-')
+TIME_SENSITIVE_RE = re.compile(r'time[\s-]*sens')
+
+# Key events that could trigger macro player hotkeys:
+# HOME (36), END (35), PAGE UP (33), PAGE DOWN (34), ESC (27), PAUSE/BREAK (19), PRINT SCREEN (44)
+KEY_EVENT_TYPES = frozenset({'KeyDown', 'KeyUp'})
+PROBLEMATIC_KEYCODES = frozenset({27, 19, 33, 34, 35, 36, 44})
+
+# Mouse events that get pre-move jitter (exact Type strings, checked once per event)
+JITTER_EVENT_TYPES = frozenset({'MouseMove', 'Click', 'RightDown'})
+
 
 def load_folder_whitelist(root_path: Path) -> dict:
     """
@@ -106,7 +126,14 @@ def should_process_folder(folder_path: Path, originals_root: Path, whitelist: di
 # Chat inserts are loaded from 'chat inserts' folder at runtime
 def load_json_events(path: Path):
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        data = None
+        if orjson is not None:
+            try:
+                data = orjson.loads(path.read_bytes())
+            except orjson.JSONDecodeError:
+                pass  # e.g. NaN/Infinity or >64-bit ints: stdlib json accepts those
+        if data is None:
+            data = json.loads(path.read_text(encoding="utf-8"))
         events = []
         if isinstance(data, dict):
             found_list = None
@@ -121,17 +148,34 @@ def load_json_events(path: Path):
         cleaned = []
         for e in events:
             if isinstance(e, list) and len(e) > 0: e = e[0]
-            if isinstance(e, dict) and "Time" in e: cleaned.append(e)
+            if isinstance(e, dict) and "Time" in e:
+                # Normalize Time once here so later stages can use e["Time"] directly:
+                # ints and finite floats are kept as-is (no fraction lost), numeric
+                # strings become ints, anything else (None, "abc", inf, nan) is dropped
+                t = e["Time"]
+                if type(t) is not int and not (type(t) is float and math.isfinite(t)):
+                    try: e["Time"] = int(float(t))
+                    except (TypeError, ValueError, OverflowError): continue
+                cleaned.append(e)
         return cleaned
     except Exception:
         return []
 
+@functools.lru_cache(maxsize=512)
+def load_json_events_cached(path: Path) -> tuple:
+    """
+    Parse a source file once per process and keep the events.
+    Versions reuse the same files over and over; callers must copy the
+    events (e.g. [dict(e) for e in ...]) before mutating them.
+    """
+    return tuple(load_json_events(path))
+
 def get_file_duration_ms(path: Path) -> int:
     events = load_json_events(path)
     if not events: return 0
     try:
-        times = [int(e.get("Time", 0)) for e in events]
-        return max(times) - min(times)
+        times = [e["Time"] for e in events]
+        return int(max(times)) - int(min(times))
     except: return 0
 
 def format_ms_precise(ms: int) -> str:
@@ -140,7 +184,7 @@ def format_ms_precise(ms: int) -> str:
     return f"{m}m {s}s" if m > 0 else f"{s}s"
 
 def clean_identity(name: str) -> str:
-    return re.sub(r'(\s*-\s*Copy(\s*\(\d+\))?)|(\s*\(\d+\))', '', name, flags=re.IGNORECASE).strip().lower()
+    return COPY_SUFFIX_RE.sub('', name).strip().lower()
 
 
 def find_drop_only_files(folder_path: Path, all_files: list) -> list:
@@ -171,7 +215,7 @@ def extract_folder_number(folder_name: str) -> int:
     Extract number from folder name like '1-Mining' or '23-Fishing'.
     Returns the number, or 0 if not found.
     """
-    match = re.match(r'^(\d+)-', folder_name)
+    match = FOLDER_NUMBER_RE.match(folder_name)
     if match:
         return int(match.group(1))
     return 0
@@ -185,31 +229,35 @@ def is_always_first_or_last_file(filename: str) -> bool:
     patterns = ["always first", "always last", "alwaysfirst", "alwayslast"]
     return any(pattern in filename_lower for pattern in patterns)
 
-def is_in_drag_sequence(events, index):
+def mark_drag_sequences(events) -> list:
     """
-    Check if the given index is inside a drag sequence (between DragStart and DragEnd).
-    Returns True if we're in the middle of a drag.
+    For every index, True if it is inside a drag sequence (between DragStart
+    and DragEnd). Two linear passes instead of scanning out from each index.
     """
+    n = len(events)
+    in_drag = [False] * n
+    
+    # Forward: was the last Drag event at or before i a DragStart?
     drag_started = False
-    for j in range(index, -1, -1):
-        event_type = events[j].get("Type", "")
-        if event_type == "DragEnd":
-            return False
-        elif event_type == "DragStart":
+    for i in range(n):
+        event_type = events[i].get("Type", "")
+        if event_type == "DragStart":
             drag_started = True
-            break
-    
-    if not drag_started:
-        return False
+        elif event_type == "DragEnd":
+            drag_started = False
+        in_drag[i] = drag_started
     
-    for j in range(index + 1, len(events)):
-        event_type = events[j].get("Type", "")
+    # Backward: is the next Drag event after i a DragEnd?
+    ends_later = False
+    for i in range(n - 1, -1, -1):
+        in_drag[i] = in_drag[i] and ends_later
+        event_type = events[i].get("Type", "")
         if event_type == "DragEnd":
-            return True
+            ends_later = True
         elif event_type == "DragStart":
-            return False
+            ends_later = False
     
-    return False
+    return in_drag
 
 def generate_human_path(start_x, start_y, end_x, end_y, duration_ms, rng):
     """
@@ -222,20 +270,26 @@ def generate_human_path(start_x, start_y, end_x, end_y, duration_ms, rng):
     
     path = []
     
-    # Calculate distance
+    # Calculate distance (reject short hops on the squared distance, before any sqrt)
     dx = end_x - start_x
     dy = end_y - start_y
-    distance = math.sqrt(dx**2 + dy**2)
+    dist_sq = dx * dx + dy * dy
     
-    if distance < 5:
+    if dist_sq < 25:
         return [(0, end_x, end_y)]
     
+    distance = math.sqrt(dist_sq)
+    
     # Determine speed profile (variable speeds make it human)
     speed_profile = rng.choice(['fast_start', 'slow_start', 'medium', 'hesitant'])
     
     # Number of steps based on distance and duration
     num_steps = max(3, min(int(distance / 15), int(duration_ms / 50)))
     
+    # Direction scaled by 1/(distance+1); loop-invariant, so computed once
+    dir_x = dx / (distance + 1)
+    dir_y = dy / (distance + 1)
+    
     # Add control points for curve (not perfect bezier)
     num_control = rng.randint(1, 3)
     control_points = []
@@ -243,11 +297,12 @@ def generate_human_path(start_x, start_y, end_x, end_y, duration_ms, rng):
         # Offset perpendicular to main direction
         offset = rng.uniform(-0.3, 0.3) * distance
         t = rng.uniform(0.2, 0.8)
-        ctrl_x = start_x + dx * t + (-dy / (distance + 1)) * offset
-        ctrl_y = start_y + dy * t + (dx / (distance + 1)) * offset
+        ctrl_x = start_x + dx * t + (-dir_y) * offset
+        ctrl_y = start_y + dy * t + dir_x * offset
         control_points.append((ctrl_x, ctrl_y, t))
     
-    control_points.sort(key=lambda p: p[2])  # Sort by t position
+    control_points.sort(key=itemgetter(2))  # Sort by t position
+    last_ctrl = len(control_points) - 1
     
     current_time = 0
     
@@ -283,7 +338,7 @@ def generate_human_path(start_x, start_y, end_x, end_y, duration_ms, rng):
                     y = start_y + (ctrl_y - start_y) * segment_t
                     break
                 else:
-                    if i == len(control_points) - 1:
+                    if i == last_ctrl:
                         # Last segment
                         segment_t = (t - ctrl_t) / (1 - ctrl_t) if (1 - ctrl_t) > 0 else 0
                         x = ctrl_x + (end_x - ctrl_x) * segment_t
@@ -300,8 +355,8 @@ def generate_human_path(start_x, start_y, end_x, end_y, duration_ms, rng):
         if step > 0 and step < num_steps and rng.random() < 0.15:
             overshoot = rng.uniform(5, 15)
             direction = 1 if rng.random() < 0.5 else -1
-            x += direction * overshoot * (dx / (distance + 1))
-            y += direction * overshoot * (dy / (distance + 1))
+            x += direction * overshoot * dir_x
+            y += direction * overshoot * dir_y
         
         # Keep within bounds
         x = max(100, min(1800, int(x)))
@@ -337,23 +392,23 @@ def add_pre_click_jitter(events: list, rng: random.Random) -> tuple:
     
     jitter_count = 0
     total_moves = 0
-    i = 0
+    # Build a new list rather than list.insert() into the middle (O(N) per insert)
+    result = []
     
-    while i < len(events):
-        event = events[i]
+    for event in events:
         event_type = event.get('Type', '')
         
         # Apply to ALL mouse movements (MouseMove, Click, RightDown)
-        if event_type in ('MouseMove', 'Click', 'RightDown'):
+        if isinstance(event_type, str) and event_type in JITTER_EVENT_TYPES:
             total_moves += 1
             
             # Random chance based on jitter_percentage
             if rng.random() < jitter_percentage:
                 move_x = event.get('X')
                 move_y = event.get('Y')
-                move_time = event.get('Time')
+                move_time = event['Time']
                 
-                if move_x is not None and move_y is not None and move_time is not None:
+                if move_x is not None and move_y is not None:
                     num_jitters = rng.randint(2, 3)
                     jitter_events = []
                     
@@ -389,15 +444,12 @@ def add_pre_click_jitter(events: list, rng: random.Random) -> tuple:
                         'Y': int(move_y)
                     })
                     
-                    for idx, jitter_event in enumerate(jitter_events):
-                        events.insert(i + idx, jitter_event)
-                    
-                    i += len(jitter_events)
+                    result.extend(jitter_events)
                     jitter_count += 1
         
-        i += 1
+        result.append(event)
     
-    return events, jitter_count, total_moves, jitter_percentage
+    return result, jitter_count, total_moves, jitter_percentage
 
 def insert_chat_from_file(events: list, rng: random.Random, chat_files: list) -> tuple:
     """
@@ -431,23 +483,22 @@ def insert_chat_from_file(events: list, rng: random.Random, chat_files: list) ->
         insertion_point = rng.randint(start_idx, end_idx)
         
         # Get time at insertion point
-        base_time = events[insertion_point].get('Time', 0)
+        base_time = events[insertion_point]['Time']
         
         # Normalize chat events to start at base_time
-        chat_start_time = min(e.get('Time', 0) for e in chat_events)
+        chat_start_time = min(map(itemgetter('Time'), chat_events))
         for event in chat_events:
             event['Time'] = event['Time'] - chat_start_time + base_time
         
         # Calculate chat duration
-        chat_duration = max(e.get('Time', 0) for e in chat_events) - base_time
+        chat_duration = max(map(itemgetter('Time'), chat_events)) - base_time
         
         # Shift all events AFTER insertion point (no rounding!)
         for i in range(insertion_point, len(events)):
             events[i]['Time'] = events[i]['Time'] + chat_duration
         
-        # Insert chat events
-        for i, chat_event in enumerate(chat_events):
-            events.insert(insertion_point + i, chat_event)
+        # Insert chat events (one slice assignment, not one insert per event)
+        events[insertion_point:insertion_point] = chat_events
         
         return events, True
         
@@ -455,6 +506,22 @@ def insert_chat_from_file(events: list, rng: random.Random, chat_files: list) ->
         print(f"  âš ï¸ Error loading chat file {chat_file.name}: {e}")
         return events, False
 
+def apply_pauses(events: list, pauses: dict) -> int:
+    """
+    Apply {event_index: pause_ms}: each event is shifted by every pause at
+    or before its index. One cumulative pass instead of re-shifting the
+    tail once per pause. Returns the total pause added.
+    """
+    if not pauses:
+        return 0
+    
+    shift = 0
+    for j in range(min(pauses), len(events)):
+        shift += pauses.get(j, 0)
+        events[j]["Time"] = events[j]["Time"] + shift  # No rounding!
+    
+    return sum(pauses.values())
+
 def insert_intra_file_pauses(events: list, rng: random.Random) -> tuple:
     """
     Insert random pauses before recorded actions.
@@ -477,19 +544,10 @@ def insert_intra_file_pauses(events: list, rng: random.Random) -> tuple:
     pause_indices = rng.sample(range(1, len(events)), num_pauses)
     pause_indices.sort()
     
-    total_pause_added = 0
-    
-    # Apply pauses at selected indices
-    for pause_idx in pause_indices:
-        # Generate non-rounded pause duration (1000-2000ms)
-        pause_duration = int(rng.uniform(1000.123, 1999.987))
-        total_pause_added += pause_duration
-        
-        # Shift this event and all subsequent events by the pause (no rounding!)
-        for j in range(pause_idx, len(events)):
-            events[j]["Time"] = events[j]["Time"] + pause_duration
+    # Generate non-rounded pause durations (1000-2000ms)
+    pauses = {pause_idx: int(rng.uniform(1000.123, 1999.987)) for pause_idx in pause_indices}
     
-    return events, total_pause_added
+    return events, apply_pauses(events, pauses)
 
 def insert_normal_file_pauses(events: list, rng: random.Random) -> tuple:
     """
@@ -511,39 +569,38 @@ def insert_normal_file_pauses(events: list, rng: random.Random) -> tuple:
     pause_indices = rng.sample(range(1, len(events)), num_pauses)
     pause_indices.sort()
     
-    total_pause_added = 0
+    # Generate non-rounded pause durations (0-2 minutes = 0-120000ms)
+    pauses = {pause_idx: int(rng.uniform(0.123, 119999.987)) for pause_idx in pause_indices}
     
-    # Apply pauses at selected indices
-    for pause_idx in pause_indices:
-        # Generate non-rounded pause duration (0-2 minutes = 0-120000ms)
-        pause_duration = int(rng.uniform(0.123, 119999.987))
-        total_pause_added += pause_duration
-        
-        # Shift this event and all subsequent events by the pause (no rounding!)
-        for j in range(pause_idx, len(events)):
-            events[j]["Time"] = events[j]["Time"] + pause_duration
-    
-    return events, total_pause_added
+    return events, apply_pauses(events, pauses)
+
+def is_problematic_key_event(event: dict) -> bool:
+    """
+    True for a KeyDown/KeyUp event whose KeyCode is a problematic hotkey.
+    Malformed values (e.g. a list as Type or KeyCode) are never problematic,
+    rather than raising TypeError from the frozenset lookup.
+    """
+    event_type = event.get('Type')
+    if not isinstance(event_type, str) or event_type not in KEY_EVENT_TYPES:
+        return False
+    try:
+        return event.get('KeyCode') in PROBLEMATIC_KEYCODES
+    except TypeError:  # unhashable KeyCode
+        return False
 
 def filter_problematic_keys(events: list) -> list:
     """
     Remove problematic key events that could trigger macro player hotkeys.
     Filters out: HOME (36), END (35), PAGE UP (33), PAGE DOWN (34), 
     ESC (27), PAUSE/BREAK (19), PRINT SCREEN (44)
+
+    Returns the input list unchanged when it holds no problematic keys.
     """
-    problematic_keycodes = {27, 19, 33, 34, 35, 36, 44}
-    
-    filtered = []
-    for event in events:
-        # Skip KeyDown/KeyUp events with problematic keycodes
-        if event.get('Type') in ['KeyDown', 'KeyUp']:
-            keycode = event.get('KeyCode')
-            if keycode in problematic_keycodes:
-                continue  # Skip this event
-        
-        filtered.append(event)
-    
-    return filtered
+    if not any(map(is_problematic_key_event, events)):
+        return events
+
+    # Skip KeyDown/KeyUp events with problematic keycodes
+    return [event for event in events if not is_problematic_key_event(event)]
 
 def insert_idle_mouse_movements(events, rng, movement_percentage):
     """
@@ -560,20 +617,28 @@ def insert_idle_mouse_movements(events, rng, movement_percentage):
     
     result = []
     total_idle_time = 0
+    in_drag = None  # Built on the first long gap
+    last_idx = len(events) - 1
+    next_time = int(events[0]["Time"])
+    # Start position of the last handled gap, and the index its backward scan began at
+    last_pos = (500, 500)
+    scanned_to = -1
     
     for i in range(len(events)):
         result.append(events[i])
         
-        # Check gap to next event
-        if i < len(events) - 1:
-            current_time = int(events[i].get("Time", 0))
-            next_time = int(events[i + 1].get("Time", 0))
+        # Check gap to next event (each Time is read once, then carried forward)
+        if i < last_idx:
+            current_time = next_time
+            next_time = int(events[i + 1]["Time"])
             gap = next_time - current_time
             
             # Only process gaps >= 5 seconds
             if gap >= 5000:
                 # Skip if in drag sequence
-                if is_in_drag_sequence(events, i):
+                if in_drag is None:
+                    in_drag = mark_drag_sequences(events)
+                if in_drag[i]:
                     continue
                 
                 # Calculate active window
@@ -581,15 +646,17 @@ def insert_idle_mouse_movements(events, rng, movement_percentage):
                 buffer_start = (gap - active_duration) // 2
                 movement_start = current_time + buffer_start
                 
-                # Get start position
-                start_x, start_y = 500, 500
-                for j in range(i, -1, -1):
+                # Get start position (only scan back to where the previous gap's scan began)
+                start_x, start_y = last_pos
+                for j in range(i, scanned_to, -1):
                     x_val = events[j].get("X")
                     y_val = events[j].get("Y")
                     if x_val is not None and y_val is not None:
                         start_x = int(x_val)
                         start_y = int(y_val)
                         break
+                last_pos = (start_x, start_y)
+                scanned_to = i
                 
                 # Get next position (where we need to end up)
                 next_x, next_y = start_x, start_y
@@ -798,16 +865,29 @@ def insert_idle_mouse_movements(events, rng, movement_percentage):
     
     return result, total_idle_time
 
+def split_by_efficiency(all_files: list) -> tuple:
+    """
+    Split a folder's files into (efficient, inefficient) lists.
+    Inefficient files carry "¬¬" in their name. Done once per folder,
+    since every version of that folder uses the same split.
+    """
+    efficient, inefficient = [], []
+    for f in all_files:
+        (inefficient if "¬¬" in f.name else efficient).append(f)
+    return efficient, inefficient
+
 class QueueFileSelector:
-    def __init__(self, rng, all_files, durations_cache):
+    def __init__(self, rng, efficient, inefficient, durations_cache):
         self.rng = rng
         self.durations = durations_cache
-        self.efficient = [f for f in all_files if "¬¬" not in f.name]
-        self.inefficient = [f for f in all_files if "¬¬" in f.name]
+        self.efficient = efficient
+        self.inefficient = inefficient
         self.eff_pool = list(self.efficient)
         self.ineff_pool = list(self.inefficient)
         self.rng.shuffle(self.eff_pool)
         self.rng.shuffle(self.ineff_pool)
+        # Pools are consumed from the end: pop() is O(1) and, after a
+        # shuffle, the end is as random as the front.
 
     def get_sequence(self, target_minutes, force_inef=False, is_time_sensitive=False):
         seq, cur_ms = [], 0.0
@@ -825,12 +905,12 @@ class QueueFileSelector:
         
         while cur_ms < target_max:
             # Try to get next file
-            if actual_force and self.ineff_pool: pick = self.ineff_pool.pop(0)
-            elif self.eff_pool: pick = self.eff_pool.pop(0)
+            if actual_force and self.ineff_pool: pick = self.ineff_pool.pop()
+            elif self.eff_pool: pick = self.eff_pool.pop()
             elif self.efficient:
                 self.eff_pool = list(self.efficient); self.rng.shuffle(self.eff_pool)
-                pick = self.eff_pool.pop(0)
-            elif self.ineff_pool and not is_time_sensitive: pick = self.ineff_pool.pop(0)
+                pick = self.eff_pool.pop()
+            elif self.ineff_pool and not is_time_sensitive: pick = self.ineff_pool.pop()
             else: break  # No more files
             
             file_duration = self.durations.get(pick, 500)
@@ -868,6 +948,404 @@ class QueueFileSelector:
         return seq
 
 
+def has_usable_events(path: Path) -> bool:
+    """True if the file still has events once problematic keys are filtered out."""
+    return bool(filter_problematic_keys(load_json_events(path)))
+
+def plan_merged_version(job: dict) -> dict:
+    """
+    Draw the parts of a version that are decided before any file is merged:
+    version type, multipliers, file sequence, DROP ONLY pick and chat slot.
+    Deterministic per job seed, so main() can replay it to decide whether the
+    version takes a chat file, and the worker then continues from the same rng.
+    chat_slot is the file index a chat would go before (-1 = no slot).
+    """
+    rng = random.Random(job["seed"])
+    v_idx = job["v_idx"]
+    raw_v = job["raw_v"]
+    inef_v = job["inef_v"]
+
+    # Determine file type based on NEW ordering
+    if v_idx <= raw_v:
+        is_raw = True
+        is_inef = False
+        is_ts_version = False
+    elif v_idx <= raw_v + inef_v:
+        is_raw = False
+        is_inef = True
+        is_ts_version = False
+    else:
+        is_raw = False
+        is_inef = False
+        is_ts_version = job["is_ts"]  # Only normal files can be TS
+
+    if is_ts_version: mult = rng.choice([1.0, 1.2, 1.5])
+    elif is_inef:     mult = rng.choices([1, 2, 3], weights=[20, 40, 40], k=1)[0]
+    elif is_raw:      mult = rng.choices([1, 2, 3], weights=[50, 30, 20], k=1)[0]
+    else:             mult = rng.choices([1, 2, 3], weights=[50, 30, 20], k=1)[0]
+
+    movement_percentage = rng.uniform(0.40, 0.50)
+
+    paths = QueueFileSelector(rng, job["efficient"], job["inefficient"], job["durations"]).get_sequence(job["target_minutes"], is_inef, is_ts_version)
+
+    # DROP ONLY insertion for Mining folders: select ONE random DROP file
+    drop_only_file = rng.choice(job["drop_only_files"]) if paths and job["drop_only_files"] else None
+
+    # Chat - only 1 per merged file, before a random file (never the first)
+    chat_slot = rng.randint(1, len(paths) - 1) if len(paths) > 1 else -1
+
+    return {
+        "rng": rng,
+        "is_raw": is_raw,
+        "is_inef": is_inef,
+        "is_ts_version": is_ts_version,
+        "mult": mult,
+        "movement_percentage": movement_percentage,
+        "paths": paths,
+        "drop_only_file": drop_only_file,
+        "chat_slot": chat_slot,
+    }
+
+def generate_merged_version(job: dict):
+    """
+    Build and write ONE merged version (raw / inef / normal / TS) for a folder.
+    Runs inside a worker process: all inputs arrive in `job` and randomness
+    comes from the per-job seed, so versions never share state.
+    Returns the manifest entry text, or None if no files were selected.
+    """
+    plan = plan_merged_version(job)
+    rng = plan["rng"]
+    is_raw = plan["is_raw"]
+    is_inef = plan["is_inef"]
+    is_ts_version = plan["is_ts_version"]
+    mult = plan["mult"]
+    movement_percentage = plan["movement_percentage"]
+    paths = plan["paths"]
+    is_ts = job["is_ts"]
+    folder_number = job["folder_number"]
+    out_f = job["out_f"]
+
+    v_letter = chr(64 + job["v_idx"])
+    v_code = f"{folder_number}_{v_letter}"
+
+    jitter_percentage = 0.0  # Will be set per file
+    
+    total_idle_movements = 0
+    total_intra_pauses = 0
+    total_normal_pauses = 0  # NEW: Track normal file pauses
+    total_gaps = 0
+    total_afk_pool = 0
+    total_jitter_count = 0
+    total_clicks = 0
+    file_segments = []
+    massive_pause_info = None
+    merged = []
+    timeline = 0
+
+    if not paths:
+        return None
+
+    drop_only_file = plan["drop_only_file"]
+    if drop_only_file:
+        print(f"  ℹ️  Mining folder: Will insert DROP ONLY file: {drop_only_file.name}")
+
+    # Chat file (if any) was taken from the global queue by main(), which
+    # already checked that both it and the file at the chat slot have events
+    chat_used = False
+    chat_file = job["chat_file"]
+    chat_insertion_point = plan["chat_slot"] if chat_file else -1
+
+    # is_time_sensitive = True only for explicitly TS versions (not normal versions in TS folders)
+    is_time_sensitive = is_ts_version
+    
+    for i, p in enumerate(paths):
+        raw = [dict(e) for e in load_json_events_cached(p)]
+        if not raw: continue
+        
+        # Filter problematic keys
+        raw = filter_problematic_keys(raw)
+        if not raw: continue
+        
+        # INSERT CHAT ONCE (before the chosen file index)
+        if not chat_used and i == chat_insertion_point:
+            try:
+                chat_events = [dict(e) for e in load_json_events_cached(chat_file)]
+                if chat_events:
+                    chat_events = filter_problematic_keys(chat_events)
+                    if chat_events:
+                        # Normalize to current timeline
+                        chat_start = min(map(itemgetter('Time'), chat_events))
+                        chat_file_start_idx = len(merged)
+                        for e in chat_events:
+                            e['Time'] = e['Time'] - chat_start + timeline
+                            merged.append(e)
+                        
+                        timeline = merged[-1]["Time"] if merged else timeline
+                        file_segments.append({
+                            "name": chat_file.name,
+                            "end_time": timeline,
+                            "start_idx": chat_file_start_idx,
+                            "end_idx": len(merged) - 1,
+                            "is_chat": True
+                        })
+                        chat_used = True
+            except Exception as e:
+                print(f"  âš ï¸ Error loading chat {chat_file.name}: {e}")
+        
+        # Step 1: Add pre-move jitter (random 20-45% of moves)
+        # All types get jitter (doesn't affect time)
+        raw_with_jitter, jitter_count, click_count, jitter_pct = add_pre_click_jitter(raw, rng)
+        total_jitter_count += jitter_count
+        total_clicks += click_count
+        jitter_percentage = jitter_pct
+        
+        # Step 2: Insert random intra-file pauses between actions
+        # TIME SENSITIVE and RAW: Skip (adds time)
+        if not is_time_sensitive and not is_raw:
+            raw_with_pauses, intra_pause_time = insert_intra_file_pauses(raw_with_jitter, rng)
+            total_intra_pauses += intra_pause_time
+        else:
+            raw_with_pauses = raw_with_jitter
+        
+        # Step 3: Insert idle mouse movements in gaps >= 5 seconds
+        # Fills gaps with movement, does NOT add time
+        raw_with_movements, idle_time = insert_idle_mouse_movements(raw_with_pauses, rng, movement_percentage)
+        total_idle_movements += idle_time
+        
+        
+        # Rebase point: jitter/pauses can move events before the first one, so take the min
+        base_t = int(min(map(itemgetter("Time"), raw_with_movements)))
+        
+        # Inter-file gap: 500-5000ms (non-rounded) Ã— multiplier
+        if i > 0:
+            gap = int(rng.uniform(500.123, 4999.987) * mult)
+            
+            # CRITICAL: Add cursor transition during gap to prevent teleporting
+            # Get last cursor position from previous file (must have non-None X/Y)
+            last_cursor_event = None
+            for e in reversed(merged):
+                if e.get('X') is not None and e.get('Y') is not None:
+                    last_cursor_event = e
+                    break
+            
+            # Get first cursor position from current file (must have non-None X/Y)
+            first_cursor_event = None
+            for e in raw_with_movements:
+                if e.get('X') is not None and e.get('Y') is not None:
+                    first_cursor_event = e
+                    break
+            
+            # If both exist and positions differ, add smooth transition
+            if last_cursor_event and first_cursor_event:
+                last_x, last_y = int(last_cursor_event['X']), int(last_cursor_event['Y'])
+                first_x, first_y = int(first_cursor_event['X']), int(first_cursor_event['Y'])
+                
+                # Only add transition if positions are different
+                if (last_x != first_x) or (last_y != first_y):
+                    transition_path = generate_human_path(
+                        last_x, last_y,
+                        first_x, first_y,
+                        gap,
+                        rng
+                    )
+                    
+                    for rel_time, x, y in transition_path:
+                        if rel_time < gap:
+                            merged.append({
+                                'Type': 'MouseMove',
+                                'Time': timeline + rel_time,
+                                'X': x,
+                                'Y': y
+                            })
+        else:
+            gap = 0
+            
+        timeline += gap
+        total_gaps += gap
+        
+        file_start_idx = len(merged)  # Track where this file starts in merged array
+        
+        # These events are this version's own copies, so shift them in place (no rounding!)
+        shift = timeline - base_t
+        for e in raw_with_movements:
+            e["Time"] += shift
+        merged.extend(raw_with_movements)
+        
+        timeline = merged[-1]["Time"]
+        file_end_idx = len(merged) - 1
+        file_segments.append({
+            "name": p.name, 
+            "end_time": timeline,
+            "start_idx": file_start_idx,
+            "end_idx": file_end_idx,
+            "is_chat": False  # Regular file
+        })
+    
+
+
+
+
+    # INSERT DROP ONLY file in middle (Mining folders only)
+    if drop_only_file and merged and len(merged) > 10:
+        drop_events = list(load_json_events_cached(drop_only_file))
+        if drop_events:
+            drop_events = filter_problematic_keys(drop_events)
+            if drop_events:
+                # Random insertion point (25-75% through file)
+                drop_start_idx = int(len(merged) * 0.25)
+                drop_end_idx = int(len(merged) * 0.75)
+                drop_insertion_point = rng.randint(drop_start_idx, drop_end_idx)
+                
+                drop_base_time = merged[drop_insertion_point]["Time"]
+                drop_start_time = min(map(itemgetter("Time"), drop_events))
+                normalized_drop = []
+                for e in drop_events:
+                    ne = {**e}
+                    ne["Time"] = e["Time"] - drop_start_time + drop_base_time
+                    normalized_drop.append(ne)
+                
+                drop_duration = max(map(itemgetter("Time"), normalized_drop)) - drop_base_time
+                
+                # Shift all events AFTER insertion point by drop duration
+                for j in range(drop_insertion_point, len(merged)):
+                    merged[j]["Time"] += drop_duration
+                
+                # Insert DROP events at the insertion point (one slice assignment)
+                merged[drop_insertion_point:drop_insertion_point] = normalized_drop
+                
+                timeline = merged[-1]["Time"]
+                
+                file_segments.append({
+                    "name": f"[DROP ONLY] {drop_only_file.name}",
+                    "end_time": drop_base_time + drop_duration,
+                    "start_idx": drop_insertion_point,
+                    "end_idx": drop_insertion_point + len(normalized_drop) - 1,
+                    "is_chat": False
+                })
+                
+                print(f"    ✓ Inserted DROP ONLY at {format_ms_precise(drop_base_time)}")
+
+    total_afk_pool = total_idle_movements
+    chat_inserted = chat_used  # Track if chat was used
+    
+    # Normal File Pause: only for NORMAL files (not inef, not TS, not raw)
+    if not is_inef and not is_time_sensitive and not is_raw and merged:
+        merged, normal_pause_time = insert_normal_file_pauses(merged, rng)
+        total_normal_pauses += normal_pause_time
+        if normal_pause_time > 0:
+            timeline = merged[-1]["Time"]
+            # Update file_segments to reflect new timeline after pauses
+            for seg in file_segments:
+                if seg["end_idx"] < len(merged):
+                    seg["end_time"] = merged[seg["end_idx"]]["Time"]
+    
+    if is_inef and not is_ts and len(merged) > 1:
+        # Massive pause: 4-9 minutes (240000-540000ms)
+        p_ms = rng.randint(240000, 540000)
+        split = rng.randint(0, len(merged) - 2)
+        for j in range(split + 1, len(merged)): merged[j]["Time"] += p_ms
+        timeline = merged[-1]["Time"]
+        massive_pause_info = f"Massive P1: {format_ms_precise(p_ms)}"
+        
+        for seg in file_segments:
+            if seg["end_idx"] > split:
+                seg["end_time"] = merged[seg["end_idx"]]["Time"]
+    
+    # Calculate exact time for filename
+    total_minutes = int(timeline / 60000)
+    total_seconds = int((timeline % 60000) / 1000)
+    
+    # File prefix: ¬¬ = inefficient, ^ = raw, blank = normal/TS
+    if is_raw:        prefix = "^"
+    elif is_inef:     prefix = "¬¬"
+    else:             prefix = ""
+    
+    fname = f"{prefix}{v_code}_{total_minutes}m{total_seconds}s.json"
+    # orjson's default output matches separators=(",", ":") and OPT_INDENT_2 matches
+    # indent=2, but it writes non-ASCII as raw UTF-8 where json escapes it, so only
+    # ASCII output is kept. (Floats in exponent form and NaN are also spelled
+    # differently; recorded events hold ints and strings.)
+    data = orjson.dumps(merged, option=0 if job["compact"] else orjson.OPT_INDENT_2) if orjson is not None else None
+    if data is not None and data.isascii():
+        (out_f / fname).write_bytes(data)
+    elif job["compact"]:
+        # No indent lets json use its one-shot C encoder (indent=2 forces the pure-Python one)
+        (out_f / fname).write_text(json.dumps(merged, separators=(",", ":")))
+    else:
+        # indent=2 is pure-Python either way, so stream it instead of building one huge string
+        with open(out_f / fname, "w", encoding="utf-8", buffering=1 << 20) as fp:
+            json.dump(merged, fp, indent=2)
+    
+    # Calculate pause time (idle movements are informational only)
+    total_pause = total_intra_pauses + total_gaps + total_normal_pauses
+    
+    # Determine file type
+    if is_ts_version:
+        file_type = "Time sensitive"
+    elif is_inef:
+        file_type = "Inefficient"
+    elif is_raw:
+        file_type = "Raw"
+    else:
+        file_type = "Normal"
+    
+    # Calculate pause times
+    # Only inter-file gaps get multiplied!
+    original_intra = total_intra_pauses  # Not multiplied
+    original_inter = int(total_gaps / mult) if mult > 0 else total_gaps
+    original_normal = total_normal_pauses
+    original_total = original_intra + original_inter + original_normal
+    
+    # Calculate total time in minutes and seconds
+    total_min = int(timeline / 60000)
+    total_sec = int((timeline % 60000) / 1000)
+    
+    # Version label with duration and separator
+    version_label = f"Version {prefix}{v_code}_{total_min}m{total_sec}s:"
+    separator = "=" * 40
+    
+    if is_raw:
+        # Raw files: minimal manifest (only inter-file gaps, no anti-detection)
+        manifest_entry = [
+            separator,
+            " ",
+            version_label,
+            f"FILE TYPE: Raw (no time-adding features, no chat)",
+            f"  Between files pause: {format_ms_precise(total_gaps)} (x{mult} Multiplier)",
+        ]
+    else:
+        manifest_entry = [
+            separator,
+            " ",
+            version_label,
+            f"FILE TYPE: {file_type}",
+            f"  Total PAUSE ADDED: {format_ms_precise(total_pause)} (x{mult} Multiplier)",
+            f"BREAKDOWN",
+            f"total before    - Within original files pauses: {format_ms_precise(original_intra)}",
+            f"multiplier      - Between original files pauses: {format_ms_precise(original_inter)}",
+            f"                - Normal file pause: {format_ms_precise(original_normal)}",
+        ]
+    
+    # Idle and jitter: all types (raw included, since they don't add time)
+    manifest_entry.extend([
+        f"Idle Mouse Movements: {format_ms_precise(total_idle_movements)}",
+        f"Mouse Jitter: {int(jitter_percentage * 100)}%"
+    ])
+    
+    # Add files list with chat highlighting
+    # Sort file segments by end_time for chronological order
+    file_segments.sort(key=itemgetter("end_time"))
+    
+    manifest_entry.append("")
+    for seg in file_segments:
+        if seg.get("is_chat", False):
+            manifest_entry.append(f"  ****** {seg['name']} (Ends at {format_ms_precise(seg['end_time'])})")
+        else:
+            manifest_entry.append(f"  * {seg['name']} (Ends at {format_ms_precise(seg['end_time'])})")
+    
+    return "\n".join(manifest_entry)
+
+
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("input_root", type=str)
@@ -878,6 +1356,10 @@ def main():
     parser.add_argument("--speed-range", type=str, default="1.0 1.0")
     parser.add_argument("--no-chat", action="store_true", help="Disable chat inserts (default: enabled)")
     parser.add_argument("--use-whitelist", action="store_true", help="Use whitelist from 'specific folders to include for merge.txt' (default: off)")
+    parser.add_argument("--compact", "--no-indent", action="store_true", help="Write merged JSON without indentation (about half the size, ~3x faster to encode)")
+    # ProcessPoolExecutor rejects more than 61 workers on Windows
+    parser.add_argument("--workers", type=int, default=min(os.cpu_count() or 1, 61), help="Worker processes for generating merged files (default: all cores up to 61, 1 = serial)")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for reproducible output from the same input tree (default: random)")
     args = parser.parse_args()
 
     search_base = Path(args.input_root).resolve()
@@ -894,6 +1376,9 @@ def main():
     if not originals_root:
         originals_root = search_base
     
+    if orjson is None:
+        print("ℹ️  orjson not installed: using the stdlib json module (same output, slower)")
+    
     # NEW: Load folder whitelist (only if --use-whitelist flag is set)
     folder_whitelist = None
     if args.use_whitelist:
@@ -911,10 +1396,25 @@ def main():
     for location_dir in [originals_root, originals_root.parent, search_base]:
         if logout_file:
             break
+        # List the directory once; fall back to probing each name if it can't be listed
+        try:
+            with os.scandir(location_dir) as it:
+                entries = {entry.name: entry for entry in it}
+        except OSError:
+            entries = None
+        lowered_names = {name.lower() for name in entries} if entries is not None else None
         for pattern in logout_patterns:
             test_file = location_dir / pattern
             for test_path in [test_file, Path(str(test_file) + ".json")]:
-                if test_path.exists() and test_path.is_file():
+                name = test_path.name
+                if entries is not None and name in entries:
+                    found = entries[name].is_file()
+                elif entries is None or name.lower() in lowered_names:
+                    # Unlistable dir, or a case variant: let the filesystem's own case rules decide
+                    found = test_path.exists() and test_path.is_file()
+                else:
+                    found = False
+                if found:
                     logout_file = test_path
                     print(f"âœ“ Found logout file at: {logout_file}")
                     break
@@ -923,7 +1423,7 @@ def main():
 
     bundle_dir = args.output_root / f"merged_bundle_{args.bundle_id}"
     bundle_dir.mkdir(parents=True, exist_ok=True)
-    rng = random.Random()
+    rng = random.Random(args.seed)
     pools = {}
     durations_cache = {}
     
@@ -932,7 +1432,7 @@ def main():
     if not args.no_chat:
         chat_dir = Path(args.input_root).parent / "chat inserts"
         if chat_dir.exists() and chat_dir.is_dir():
-            chat_files = list(chat_dir.glob("*.json"))
+            chat_files = sorted(chat_dir.glob("*.json"))
             if chat_files:
                 print(f"âœ“ Found {len(chat_files)} chat insert files in: {chat_dir}")
             else:
@@ -947,10 +1447,15 @@ def main():
     processed_folders = []
 
 
+    skip_dirs = {".git", ".github", "output"}
     for root, dirs, files in os.walk(originals_root):
+        # Prune in place so os.walk never descends into skipped trees; sort dirs
+        # and files so a --seed run does not depend on directory listing order
+        dirs[:] = sorted(d for d in dirs if d not in skip_dirs)
         curr = Path(root)
-        if any(p in curr.parts for p in [".git", ".github", "output"]): continue
+        if any(p in curr.parts for p in skip_dirs): continue
         
+        files.sort()
         jsons = [f for f in files if f.endswith(".json") and "click_zones" not in f.lower()]
         non_jsons = [f for f in files if not f.endswith(".json")]
         
@@ -967,15 +1472,16 @@ def main():
         macro_id = clean_identity(curr.name)
         rel_path = curr.relative_to(originals_root)
             
-        parent_scope = None
-        for part in curr.parts:
-            if "desktop" in part.lower() or "mobile" in part.lower():
-                parent_scope = part
-                break
-            
         key = str(rel_path).lower()
         if key not in pools:
-            is_ts = bool(re.search(r'time[\s-]*sens', key))
+            parent_scope = None
+            for part in curr.parts:
+                part_lower = part.lower()
+                if "desktop" in part_lower or "mobile" in part_lower:
+                    parent_scope = part
+                    break
+
+            is_ts = bool(TIME_SENSITIVE_RE.search(key))
             file_paths = [curr / f for f in jsons]
             
             # Separate DROP ONLY files from regular files (for Mining folders)
@@ -983,7 +1489,8 @@ def main():
             
             # Remove DROP ONLY files from regular merge pool
             if drop_only_files:
-                file_paths = [f for f in file_paths if f not in drop_only_files]
+                drop_only_set = set(drop_only_files)
+                file_paths = [f for f in file_paths if f not in drop_only_set]
                 print(f"  Found {len(drop_only_files)} DROP ONLY file(s), excluded from regular pool")
             
                 
@@ -1002,8 +1509,10 @@ def main():
 
     for pool_key, pool_data in pools.items():
         all_files = pool_data["files"]
-        always_files = [f for f in all_files if is_always_first_or_last_file(Path(f).name)]
-        mergeable_files = [f for f in all_files if f not in always_files]
+        # One pass: files are already Paths, and list membership against always_files is O(n*m)
+        always_files, mergeable_files = [], []
+        for f in all_files:
+            (always_files if is_always_first_or_last_file(f.name) else mergeable_files).append(f)
         pool_data["files"] = mergeable_files
         pool_data["always_files"] = always_files
     
@@ -1023,6 +1532,8 @@ def main():
         
         data["folder_number"] = folder_number
     
+    jobs = []
+    manifests = {}
     for key, data in pools.items():
         folder_number = data["folder_number"]
         
@@ -1115,351 +1626,61 @@ def main():
         # 2. Inefficient files (inef_v): indices 4, 5, 6 → letters D, E, F
         # 3. Normal files (norm_v = 6): indices 7-12 → letters G, H, I, J, K, L
         
-        for v_idx in range(1, total_v + 1):
-            # Determine file type based on NEW ordering
-            if v_idx <= raw_v:
-                is_raw = True
-                is_inef = False
-                is_ts_version = False
-            elif v_idx <= raw_v + inef_v:
-                is_raw = False
-                is_inef = True
-                is_ts_version = False
-            else:
-                is_raw = False
-                is_inef = False
-                is_ts_version = is_ts  # Only normal files can be TS
-            
-            v_letter = chr(64 + v_idx)
-            v_code = f"{folder_number}_{v_letter}"
-
-            if is_ts_version: mult = rng.choice([1.0, 1.2, 1.5])
-            elif is_inef:     mult = rng.choices([1, 2, 3], weights=[20, 40, 40], k=1)[0]
-            elif is_raw:      mult = rng.choices([1, 2, 3], weights=[50, 30, 20], k=1)[0]
-            else:             mult = rng.choices([1, 2, 3], weights=[50, 30, 20], k=1)[0]
+        folder_durations = {f: durations_cache[f] for f in data["files"]}
+        efficient, inefficient = split_by_efficiency(data["files"])
+        manifests[key] = (out_f, folder_number, manifest)
 
-            movement_percentage = rng.uniform(0.40, 0.50)
-            jitter_percentage = 0.0  # Will be set per file
-            
-            total_idle_movements = 0
-            total_intra_pauses = 0
-            total_normal_pauses = 0  # NEW: Track normal file pauses
-            total_gaps = 0
-            total_afk_pool = 0
-            total_jitter_count = 0
-            total_clicks = 0
-            file_segments = []
-            massive_pause_info = None
-            merged = []
-            timeline = 0
-            
-            paths = QueueFileSelector(rng, data["files"], durations_cache).get_sequence(args.target_minutes, is_inef, is_ts_version)
-            
-            if not paths:
-                continue
-
-            # DROP ONLY insertion for Mining folders (1 file in middle)
-            drop_only_file = None
-            if "drop_only_files" in data and data["drop_only_files"]:
-                # Select ONE random DROP file
-                drop_only_file = rng.choice(data["drop_only_files"])
-                print(f"  ℹ️  Mining folder: Will insert DROP ONLY file: {drop_only_file.name}")
-
-            # Chat - only 1 per merged file, using global queue
-            chat_used = False
-            # Insert chat in only 50% of merged files
+        for v_idx in range(1, total_v + 1):
+            # Chat in only 50% of merged files
             should_insert_chat = rng.random() < 0.50
-            chat_insertion_point = rng.randint(1, max(1, len(paths)-1)) if len(paths) > 1 and should_insert_chat else -1
-            file_segments = []
-            
-            for i, p in enumerate(paths):
-                raw = load_json_events(p)
-                if not raw: continue
-                
-                # Filter problematic keys
-                raw = filter_problematic_keys(raw)
-                if not raw: continue
-                
-                # is_time_sensitive = True only for explicitly TS versions (not normal versions in TS folders)
-                is_time_sensitive = is_ts_version
-                
-                # INSERT CHAT ONCE (before the chosen file index)
-                if not chat_used and i == chat_insertion_point and global_chat_queue:
-                    try:
-                        chat_file = global_chat_queue.pop(0)  # Take from front
-                        chat_events = load_json_events(chat_file)
-                        if chat_events:
-                            chat_events = filter_problematic_keys(chat_events)
-                            if chat_events:
-                                # Normalize to current timeline
-                                chat_start = min(e.get('Time', 0) for e in chat_events)
-                                chat_file_start_idx = len(merged)
-                                for e in chat_events:
-                                    e['Time'] = e['Time'] - chat_start + timeline
-                                    merged.append(e)
-                                
-                                timeline = merged[-1]["Time"] if merged else timeline
-                                file_segments.append({
-                                    "name": chat_file.name,
-                                    "end_time": timeline,
-                                    "start_idx": chat_file_start_idx,
-                                    "end_idx": len(merged) - 1,
-                                    "is_chat": True
-                                })
-                                chat_used = True
-                                
-                                # Put used file at END of queue (ensures all files used before repeat)
-                                global_chat_queue.append(chat_file)
-                                
-                                # If queue is empty, refill and shuffle
-                                if not global_chat_queue and chat_files:
-                                    global_chat_queue = list(chat_files)
-                                    rng.shuffle(global_chat_queue)
-                    except Exception as e:
-                        print(f"  âš ï¸ Error loading chat {chat_file.name}: {e}")
-                        global_chat_queue.append(chat_file)  # Return to queue
-                
-                # Step 1: Add pre-move jitter (random 20-45% of moves)
-                # All types get jitter (doesn't affect time)
-                raw_with_jitter, jitter_count, click_count, jitter_pct = add_pre_click_jitter(raw, rng)
-                total_jitter_count += jitter_count
-                total_clicks += click_count
-                jitter_percentage = jitter_pct
-                
-                # Step 2: Insert random intra-file pauses between actions
-                # TIME SENSITIVE and RAW: Skip (adds time)
-                if not is_time_sensitive and not is_raw:
-                    raw_with_pauses, intra_pause_time = insert_intra_file_pauses(raw_with_jitter, rng)
-                    total_intra_pauses += intra_pause_time
-                else:
-                    raw_with_pauses = raw_with_jitter
-                
-                # Step 3: Insert idle mouse movements in gaps >= 5 seconds
-                # Fills gaps with movement, does NOT add time
-                raw_with_movements, idle_time = insert_idle_mouse_movements(raw_with_pauses, rng, movement_percentage)
-                total_idle_movements += idle_time
-                
-                
-                t_vals = [int(e["Time"]) for e in raw_with_movements]
-                base_t = min(t_vals)
-                
-                # Inter-file gap: 500-5000ms (non-rounded) Ã— multiplier
-                if i > 0:
-                    gap = int(rng.uniform(500.123, 4999.987) * mult)
-                    
-                    # CRITICAL: Add cursor transition during gap to prevent teleporting
-                    # Get last cursor position from previous file (must have non-None X/Y)
-                    last_cursor_event = None
-                    for e in reversed(merged):
-                        if e.get('X') is not None and e.get('Y') is not None:
-                            last_cursor_event = e
-                            break
-                    
-                    # Get first cursor position from current file (must have non-None X/Y)
-                    first_cursor_event = None
-                    for e in raw_with_movements:
-                        if e.get('X') is not None and e.get('Y') is not None:
-                            first_cursor_event = e
-                            break
-                    
-                    # If both exist and positions differ, add smooth transition
-                    if last_cursor_event and first_cursor_event:
-                        last_x, last_y = int(last_cursor_event['X']), int(last_cursor_event['Y'])
-                        first_x, first_y = int(first_cursor_event['X']), int(first_cursor_event['Y'])
-                        
-                        # Only add transition if positions are different
-                        if (last_x != first_x) or (last_y != first_y):
-                            transition_path = generate_human_path(
-                                last_x, last_y,
-                                first_x, first_y,
-                                gap,
-                                rng
-                            )
-                            
-                            for rel_time, x, y in transition_path:
-                                if rel_time < gap:
-                                    merged.append({
-                                        'Type': 'MouseMove',
-                                        'Time': timeline + rel_time,
-                                        'X': x,
-                                        'Y': y
-                                    })
-                else:
-                    gap = 0
-                    
-                timeline += gap
-                total_gaps += gap
-                
-                file_start_idx = len(merged)  # Track where this file starts in merged array
-                
-                for e in raw_with_movements:
-                    ne = {**e}
-                    rel_offset = e["Time"] - base_t  # No rounding!
-                    ne["Time"] = timeline + rel_offset
-                    merged.append(ne)
-                
-                timeline = merged[-1]["Time"]
-                file_end_idx = len(merged) - 1
-                file_segments.append({
-                    "name": p.name, 
-                    "end_time": timeline,
-                    "start_idx": file_start_idx,
-                    "end_idx": file_end_idx,
-                    "is_chat": False  # Regular file
-                })
-            
 
+            job = {
+                "pool_key": key,
+                "seed": rng.getrandbits(64),
+                "v_idx": v_idx,
+                "raw_v": raw_v,
+                "inef_v": inef_v,
+                "is_ts": is_ts,
+                "folder_number": folder_number,
+                "out_f": out_f,
+                "efficient": efficient,
+                "inefficient": inefficient,
+                "durations": folder_durations,
+                "drop_only_files": data["drop_only_files"],
+                "target_minutes": args.target_minutes,
+                "chat_file": None,
+                "compact": args.compact,
+            }
 
+            # The queue stays in main() so every merged file gets a unique chat
+            # before any repeats. Replay the job's plan so a chat file is only
+            # used up when the worker will really insert it.
+            if should_insert_chat and global_chat_queue:
+                plan = plan_merged_version(job)
+                chat_slot = plan["chat_slot"]
+                if chat_slot > 0 and has_usable_events(plan["paths"][chat_slot]):
+                    chat_file = global_chat_queue.pop(0)  # Take from front
+                    if has_usable_events(chat_file):
+                        job["chat_file"] = chat_file
+                        global_chat_queue.append(chat_file)  # Put used file at END of queue
+                    else:
+                        print(f"  ⚠️ Chat file has no usable events, dropped from queue: {chat_file.name}")
 
+            jobs.append(job)
 
-            # INSERT DROP ONLY file in middle (Mining folders only)
-            if drop_only_file and merged and len(merged) > 10:
-                drop_events = load_json_events(drop_only_file)
-                if drop_events:
-                    drop_events = filter_problematic_keys(drop_events)
-                    if drop_events:
-                        # Random insertion point (25-75% through file)
-                        drop_start_idx = int(len(merged) * 0.25)
-                        drop_end_idx = int(len(merged) * 0.75)
-                        drop_insertion_point = rng.randint(drop_start_idx, drop_end_idx)
-                        
-                        drop_base_time = merged[drop_insertion_point].get("Time", 0)
-                        drop_start_time = min(e.get("Time", 0) for e in drop_events)
-                        normalized_drop = []
-                        for e in drop_events:
-                            ne = {**e}
-                            ne["Time"] = e["Time"] - drop_start_time + drop_base_time
-                            normalized_drop.append(ne)
-                        
-                        drop_duration = max(e.get("Time", 0) for e in normalized_drop) - drop_base_time
-                        
-                        # Shift all events AFTER insertion point by drop duration
-                        for j in range(drop_insertion_point, len(merged)):
-                            merged[j]["Time"] += drop_duration
-                        
-                        # Insert DROP events at the insertion point
-                        for idx, drop_event in enumerate(normalized_drop):
-                            merged.insert(drop_insertion_point + idx, drop_event)
-                        
-                        timeline = merged[-1]["Time"]
-                        
-                        file_segments.append({
-                            "name": f"[DROP ONLY] {drop_only_file.name}",
-                            "end_time": drop_base_time + drop_duration,
-                            "start_idx": drop_insertion_point,
-                            "end_idx": drop_insertion_point + len(normalized_drop) - 1,
-                            "is_chat": False
-                        })
-                        
-                        print(f"    ✓ Inserted DROP ONLY at {format_ms_precise(drop_base_time)}")
+    # Every version is independent, so spread them over all cores
+    if args.workers > 1 and len(jobs) > 1:
+        print(f"⚙️  Generating {len(jobs)} merged files with {args.workers} workers")
+        with ProcessPoolExecutor(max_workers=args.workers) as ex:
+            entries = list(ex.map(generate_merged_version, jobs))
+    else:
+        entries = [generate_merged_version(job) for job in jobs]
 
-            total_afk_pool = total_idle_movements
-            chat_inserted = chat_used  # Track if chat was used
-            
-            # Normal File Pause: only for NORMAL files (not inef, not TS, not raw)
-            if not is_inef and not is_time_sensitive and not is_raw and merged:
-                merged, normal_pause_time = insert_normal_file_pauses(merged, rng)
-                total_normal_pauses += normal_pause_time
-                if normal_pause_time > 0:
-                    timeline = merged[-1]["Time"]
-                    # Update file_segments to reflect new timeline after pauses
-                    for seg in file_segments:
-                        if seg["end_idx"] < len(merged):
-                            seg["end_time"] = merged[seg["end_idx"]]["Time"]
-            
-            if is_inef and not data["is_ts"] and len(merged) > 1:
-                # Massive pause: 4-9 minutes (240000-540000ms)
-                p_ms = rng.randint(240000, 540000)
-                split = rng.randint(0, len(merged) - 2)
-                for j in range(split + 1, len(merged)): merged[j]["Time"] += p_ms
-                timeline = merged[-1]["Time"]
-                massive_pause_info = f"Massive P1: {format_ms_precise(p_ms)}"
-                
-                for seg in file_segments:
-                    if seg["end_idx"] > split:
-                        seg["end_time"] = merged[seg["end_idx"]]["Time"]
-            
-            # Calculate exact time for filename
-            total_minutes = int(timeline / 60000)
-            total_seconds = int((timeline % 60000) / 1000)
-            
-            # File prefix: ¬¬ = inefficient, ^ = raw, blank = normal/TS
-            if is_raw:        prefix = "^"
-            elif is_inef:     prefix = "¬¬"
-            else:             prefix = ""
-            
-            fname = f"{prefix}{v_code}_{total_minutes}m{total_seconds}s.json"
-            (out_f / fname).write_text(json.dumps(merged, indent=2))
-            
-            # Calculate pause time (idle movements are informational only)
-            total_pause = total_intra_pauses + total_gaps + total_normal_pauses
-            
-            # Determine file type
-            if is_ts_version:
-                file_type = "Time sensitive"
-            elif is_inef:
-                file_type = "Inefficient"
-            elif is_raw:
-                file_type = "Raw"
-            else:
-                file_type = "Normal"
-            
-            # Calculate pause times
-            # Only inter-file gaps get multiplied!
-            original_intra = total_intra_pauses  # Not multiplied
-            original_inter = int(total_gaps / mult) if mult > 0 else total_gaps
-            original_normal = total_normal_pauses
-            original_total = original_intra + original_inter + original_normal
-            
-            # Calculate total time in minutes and seconds
-            total_min = int(timeline / 60000)
-            total_sec = int((timeline % 60000) / 1000)
-            
-            # Version label with duration and separator
-            version_label = f"Version {prefix}{v_code}_{total_min}m{total_sec}s:"
-            separator = "=" * 40
-            
-            if is_raw:
-                # Raw files: minimal manifest (only inter-file gaps, no anti-detection)
-                manifest_entry = [
-                    separator,
-                    " ",
-                    version_label,
-                    f"FILE TYPE: Raw (no time-adding features, no chat)",
-                    f"  Between files pause: {format_ms_precise(total_gaps)} (x{mult} Multiplier)",
-                ]
-            else:
-                manifest_entry = [
-                    separator,
-                    " ",
-                    version_label,
-                    f"FILE TYPE: {file_type}",
-                    f"  Total PAUSE ADDED: {format_ms_precise(total_pause)} (x{mult} Multiplier)",
-                    f"BREAKDOWN",
-                    f"total before    - Within original files pauses: {format_ms_precise(original_intra)}",
-                    f"multiplier      - Between original files pauses: {format_ms_precise(original_inter)}",
-                    f"                - Normal file pause: {format_ms_precise(original_normal)}",
-                ]
-            
-            # Idle and jitter: all types (raw included, since they don't add time)
-            manifest_entry.extend([
-                f"Idle Mouse Movements: {format_ms_precise(total_idle_movements)}",
-                f"Mouse Jitter: {int(jitter_percentage * 100)}%"
-            ])
-            
-            # Add files list with chat highlighting
-            # Sort file segments by end_time for chronological order
-            file_segments.sort(key=lambda x: x["end_time"])
-            
-            manifest_entry.append("")
-            for seg in file_segments:
-                if seg.get("is_chat", False):
-                    manifest_entry.append(f"  ****** {seg['name']} (Ends at {format_ms_precise(seg['end_time'])})")
-                else:
-                    manifest_entry.append(f"  * {seg['name']} (Ends at {format_ms_precise(seg['end_time'])})")
-            
-            manifest.append("\n".join(manifest_entry))
+    for job, entry in zip(jobs, entries):
+        if entry is not None:
+            manifests[job["pool_key"]][2].append(entry)
 
+    for out_f, folder_number, manifest in manifests.values():
         (out_f / f"!_MANIFEST_{folder_number}_!.txt").write_text("\n".join(manifest))
 
 if __name__ == "__main__":